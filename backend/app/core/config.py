@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic import PostgresDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,14 +22,15 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "focusflow"
 
     @computed_field
-    @property
+    @cached_property
     def DATABASE_URL(self) -> PostgresDsn:
         """
         Constructs the PostgreSQL database URL from individual components.
         Pydantic's PostgresDsn type will validate the final connection string.
+        The result is cached on the instance after the first access.
         """
         return PostgresDsn.build(
-            scheme="postgresql+psycopg2",
+            scheme="postgresql+psycopg",
             username=self.POSTGRES_USER,
             password=self.POSTGRES_PASSWORD,
             host=self.POSTGRES_SERVER,
@@ -35,4 +38,9 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the application settings, parsing the environment only once.
+    """
+    return Settings()
@@ -1,7 +1,23 @@
-from sqlalchemy import create_engine 
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.core.config import settings 
+from app.core.config import get_settings
 
-engine = create_engine(str(settings.DATABASE_URL), pool_pre_ping=True)
+engine = create_engine(
+    str(get_settings().DATABASE_URL),
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_engine(
+    str(get_settings().DATABASE_URL),
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)